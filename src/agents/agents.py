@@ -1,11 +1,12 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal, Union, Callable
 
 from langgraph.graph.state import CompiledStateGraph
 
 from agents.college_finder_agent.team_roster_agent import team_roster_agent
 from agents.college_finder_agent.college_agent import college_finder_agent
-from agents.marketing_agent.marketing_agent import marketing_agent
+from agents.marketing_agent.marketing_agent import get_marketing_agent
 from agents.privateagents.private.bargpt_agent.bargpt_trending_flow import BarGPTTrendingPostFlow
 from api_schema import AgentInfo
 from core.crew_agent import CrewAgent
@@ -18,7 +19,7 @@ DEFAULT_AGENT = "marketing-agent"
 class Agent:
     description: str
     type: Literal["LANGGRAPH", "CREW"]
-    graph: Union[CompiledStateGraph, CrewAgent, Callable[[], CrewAgent]] | None = None
+    graph: Union[CompiledStateGraph, CrewAgent, Callable[[], CompiledStateGraph | CrewAgent]] | None = None
 
 
 def get_vacation_house_agent():
@@ -30,7 +31,7 @@ def get_bargpt_trending_agent():
 
 all_agents: dict[str, Agent] = {
     #ADD Agents HERE
-   "marketing-agent": Agent(description="A marketing agent.", graph=marketing_agent, type="LANGGRAPH"),
+   "marketing-agent": Agent(description="A marketing agent.", graph=get_marketing_agent, type="LANGGRAPH"),
    "college-agent": Agent(description="A college agent.", graph=college_finder_agent, type="LANGGRAPH"),
    "team-roster-agent": Agent(description="A team roster agent.", graph=team_roster_agent, type="LANGGRAPH"),
    "vacation-house-agent": Agent(description="An agent to help find vacation houses.", graph=get_vacation_house_agent(), type="CREW"),
@@ -39,6 +40,8 @@ all_agents: dict[str, Agent] = {
 }
 
 
+# The registry is fixed at import time, so lookups and factory calls are cached
+@lru_cache(maxsize=len(all_agents))
 def get_agent(agent_id: str) -> Union[CompiledStateGraph, CrewAgent]:
     agent = all_agents[agent_id].graph
     if callable(agent):
@@ -46,7 +49,9 @@ def get_agent(agent_id: str) -> Union[CompiledStateGraph, CrewAgent]:
     return agent
 
 
-def get_all_agent_info() -> list[AgentInfo]:
-    return [
+@lru_cache(maxsize=1)
+def get_all_agent_info() -> tuple[AgentInfo, ...]:
+    # A tuple so the cached value can't be mutated by callers
+    return tuple(
         AgentInfo(key=agent_id, description=agent.description) for agent_id, agent in all_agents.items()
-    ]
+    )
@@ -306,15 +306,8 @@ def create_college_finder_graph() -> CompiledStateGraph:
                
             print("Updated college info", updated_college)
 
-            updated_college.has_missing_fields = any([
-                    not updated_college.tuition or updated_college.tuition is None,
-                    not updated_college.acceptance_rate or updated_college.acceptance_rate is None,
-                    not updated_college.dorm_percentage or updated_college.dorm_percentage is None,
-                    not updated_college.sat_scores or updated_college.sat_scores is None,
-                    not updated_college.programs or updated_college.programs is None,
-                    not updated_college.url or updated_college.url is None,
-                    not updated_college.enrollment or updated_college.enrollment is None
-            ])
+            # Fields were merged in after validation so refresh the flag
+            updated_college.has_missing_fields = updated_college.compute_missing_fields()
 
             # Return state with updated college and has_missing_fields flag
             return {
@@ -325,8 +318,10 @@ def create_college_finder_graph() -> CompiledStateGraph:
         # If no answer was found, return original college with empty programs list if needed
         if not college.programs:
             college.programs = []
+        # The lookup came back empty, so stop re-sending this college in later rounds
         return {
             "colleges": [college],
+            "exhausted_colleges": [college.name],
         }
 
     def gather_all_college_data(state: CollegeFinderState):
@@ -334,7 +329,8 @@ def create_college_finder_graph() -> CompiledStateGraph:
         # Initialize data_gathering_attempts if not present
         if "data_gathering_attempts" not in state:
             state["data_gathering_attempts"] = 0
-        return [Send("gather_college_info", {"college": c}) for c in state["colleges"]]
+        exhausted = set(state.get("exhausted_colleges", []))
+        return [Send("gather_college_info", {"college": c}) for c in state["colleges"] if c.name not in exhausted]
     
     def data_gathering(state: CollegeFinderState):
         # Increment attempt counter
@@ -348,7 +344,12 @@ def create_college_finder_graph() -> CompiledStateGraph:
     def should_continue_gathering(state: CollegeFinderState) -> Union[Literal["continue_gathering"], Literal["finish"]]:
         """Determine if we should continue gathering data or move to recommendations."""
         attempts = state.get("data_gathering_attempts", 0)
-        has_missing_fields = any(college_state.has_missing_fields == True for college_state in state.get("colleges", []))
+        exhausted = set(state.get("exhausted_colleges", []))
+        # Colleges whose last lookup found nothing can stay incomplete without extending the loop
+        has_missing_fields = any(
+            college_state.has_missing_fields and college_state.name not in exhausted
+            for college_state in state.get("colleges", [])
+        )
         
         if attempts < 3 and has_missing_fields:
             print(f"Some fields still missing after attempt {attempts}, continuing data gathering...")
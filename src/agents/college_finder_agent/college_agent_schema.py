@@ -1,11 +1,14 @@
 from typing import Any, Callable, List, Optional, Annotated
 from typing_extensions import TypedDict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 import operator
 from langchain_core.messages import BaseMessage
 
 from agents.tools.searchweb import SearchResult
 
+# Fields the data gathering step tries to fill in, a college missing any of them has_missing_fields
+COLLEGE_DETAIL_FIELDS = ("tuition", "acceptance_rate", "dorm_percentage", "sat_scores", "programs", "url", "enrollment")
+
 class College(BaseModel):
     name: str = Field(
         description="Name of the college"
@@ -40,27 +43,35 @@ class College(BaseModel):
     )
     has_missing_fields: bool = False
 
+    def compute_missing_fields(self) -> bool:
+        return any(not getattr(self, field) for field in COLLEGE_DETAIL_FIELDS)
+
+    @model_validator(mode="after")
+    def set_has_missing_fields(self) -> "College":
+        # Computed once at construction so checks are a plain attribute read
+        self.has_missing_fields = self.compute_missing_fields()
+        return self
+
 def colleges_reducer(current: List[College], update: List[College] | None) -> List[College]:
     #print("REDUCER Called")
-    if update is None:
+    # Nothing to merge, hand back the existing list instead of copying it
+    if not update:
         return current
     
-    result = current.copy()
+    result = list(current)
+    # Map college name to its position so matches are found without rescanning the list
+    index = {college.name: i for i, college in enumerate(result)}
     
     # Process each college in the update
     for new_college in update:
-        # Check if college with same name exists
-        found = False
-        for i, existing_college in enumerate(result):
-            if existing_college.name == new_college.name:
-                # Replace existing college
-                result[i] = new_college
-                found = True
-                break
-        
-        # Add new college if not found
-        if not found:
+        i = index.get(new_college.name)
+        if i is None:
+            # Add new college if not found
+            index[new_college.name] = len(result)
             result.append(new_college)
+        else:
+            # Replace existing college
+            result[i] = new_college
     return result
         
 
@@ -87,4 +98,5 @@ class CollegeFinderState(TypedDict):
     recommendations: Annotated[List[str], operator.add]  # Specific recommendations for the user
     messages: Annotated[List[BaseMessage], operator.add]  # Messages for ToolNode interaction
     data_gathering_attempts: int = 0  # Counter for data gathering attempts
+    exhausted_colleges: Annotated[List[str], operator.add]  # Colleges whose info lookup returned nothing
     status_updates: Annotated[List[str], operator.add] = []
\ No newline at end of file
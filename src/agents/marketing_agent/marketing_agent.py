@@ -1,9 +1,10 @@
-import subprocess
-import sys
-from typing import Annotated, Sequence, TypeVar, List
+import asyncio
+import logging
+from typing import Annotated, Sequence, List
 from typing_extensions import TypedDict
 from langgraph.graph import Graph, StateGraph
 from agents.llmtools import get_llm
+from agents.nodecache import cached_node
 from agents.marketing_agent.marketing_schema import Competitor, MarketingInput, MarketingPlanState, Persona
 from langgraph.graph.state import CompiledStateGraph
 from langgraph.checkpoint.memory import MemorySaver
@@ -12,6 +13,24 @@ from pydantic import BaseModel, Field
 from agents.tools.searchweb import scrape_web, scrape_web_agent, search_web, search_web_with_query, use_browser
 from agents.tools.wikisearch import search_wikipedia_with_query
 
+logger = logging.getLogger(__name__)
+
+# Max number of search results handled at once in finalize_competitors,
+# scrape_web's semaphore queues the fetches beyond its own limit
+SCRAPE_CONCURRENCY = 20
+# Each scraped page is truncated to this many characters in the competitor prompt
+MAX_PAGE_CHARS = 4000
+
+COMPETITOR_TEMPLATE = """Extract competitors to {app_name}, an app that {app_description}, from the following pages:
+- All links to top level domains that appear to be competitors to {app_name}
+- For each competitor also map their name and a brief description if available.
+Return at most 10, ordered by relevance to {app_name} with the most relevant competitors first.
+
+{pages}
+"""
+
+PAGE_TEMPLATE = "## Page {number} ({url})\n{content}"
+
 class PersonaList(BaseModel):
     personas: List[Persona]
 
@@ -33,22 +52,19 @@ class KeywordList(BaseModel):
 class SubredditList(BaseModel):
     subreddits: List[str]
 
+# Structured output runnables are built once and shared by every node invocation
+_LLM = get_llm()
+_PERSONAS_LLM = _LLM.with_structured_output(PersonaList)
+_KEYWORDS_LLM = _LLM.with_structured_output(KeywordList)
+_COMPETITORS_LLM = _LLM.with_structured_output(CompetitorList)
+_STRATEGIES_LLM = _LLM.with_structured_output(MarketingStrategiesList)
+_SUBREDDITS_LLM = _LLM.with_structured_output(SubredditList)
+
 def create_marketing_graph() -> CompiledStateGraph:
-    
-    # Define state type
-    workflow_state = TypeVar("workflow_state", bound=MarketingPlanState)
-
-    # Needed for Langgraph studio to work
-    # try:
-    #     subprocess.run([sys.executable, "-m", "playwright", "install-deps"], check=True)
-    #     subprocess.run([sys.executable, "-m", "playwright", "install"], check=True) 
-    #     print("Playwright browsers installed successfully!")
-    # except subprocess.CalledProcessError as e:
-    #     print(f"Error installing Playwright browsers: {e}", file=sys.stderr)
-    #     sys.exit(1)
 
     # Create personas node
-    def create_personas(state: workflow_state) -> workflow_state:
+    @cached_node("appName", "appDescription", "keyfeatures", "value_proposition", "max_personas", update_types={"personas": List[Persona]})
+    def create_personas(state: MarketingPlanState) -> MarketingPlanState:
         prompt = f"""
         Create {state['max_personas']} buyer personas for {state['appName']}.
         App description: {state['appDescription']}
@@ -60,9 +76,7 @@ def create_marketing_graph() -> CompiledStateGraph:
         Return a list of personas, each with a name and description.
         """
         
-        llm = get_llm()
-        structured_llm = llm.with_structured_output(PersonaList)
-        response = structured_llm.invoke(prompt)
+        response = _PERSONAS_LLM.invoke(prompt)
         
         # Take only up to max_personas
         max_personas = int(state['max_personas'])  # Ensure integer type
@@ -70,12 +84,12 @@ def create_marketing_graph() -> CompiledStateGraph:
         #print("len personas ", len(response.personas))
         return {"personas": response.personas[:max_personas]}
     
-    async def search_web_for_competitors(state: workflow_state):
+    async def search_web_for_competitors(state: MarketingPlanState):
         results = search_web(f"Find website with a similar value proposition: {state['value_proposition']}")
         #print("SEARCH RESULTS", results)
         return {"search_results": results}
     
-    async def search_web_for_competitors_by_hint(state: workflow_state):
+    async def search_web_for_competitors_by_hint(state: MarketingPlanState):
         if state['competitor_hint']:
             results = search_web_with_query(f"Find website similar to {state['competitor_hint']}")
             #print("SEARCH RESULTS", results)
@@ -84,9 +98,9 @@ def create_marketing_graph() -> CompiledStateGraph:
             return {}
 
     # Research competitors node using web scraping 
-    async def analyze_site(state: workflow_state) -> workflow_state:
+    async def analyze_site(state: MarketingPlanState) -> MarketingPlanState:
         url = state["appUrl"]
-        print("ANALYZING SITE", url)
+        logger.debug("Analyzing site %s", url)
         final_result = await scrape_web_agent(url,
             f"- App name\n"
             f"- Description\n"
@@ -95,16 +109,18 @@ def create_marketing_graph() -> CompiledStateGraph:
             SiteInfo
         )
         
-        # Convert the final_result to JSON string if it's an object
-        if not isinstance(final_result, (str, bytes, bytearray)):
-            final_result = final_result.model_dump_json()
-        
-        parsed = SiteInfo.model_validate_json(final_result)
+        # Structured output normally returns a SiteInfo already, only parse when it doesn't
+        if isinstance(final_result, SiteInfo):
+            parsed = final_result
+        elif isinstance(final_result, (str, bytes, bytearray)):
+            parsed = SiteInfo.model_validate_json(final_result)
+        else:
+            parsed = SiteInfo.model_validate(final_result)
         return {"appDescription": parsed.description, "keyfeatures": parsed.keyfeatures, "value_proposition": parsed.value_proposition, "appName": parsed.appName}
 
 
     # Research competitors node using Browser Use
-    async def analyze_site2(state: workflow_state) -> workflow_state:
+    async def analyze_site2(state: MarketingPlanState) -> MarketingPlanState:
         results = []
 
         final_result = await use_browser(f"""Visit website {state['appUrl']} focusing on:
@@ -122,7 +138,8 @@ def create_marketing_graph() -> CompiledStateGraph:
         else:
             return {}
 
-    async def extract_keywords(state: workflow_state) -> workflow_state:
+    @cached_node("appName", "value_proposition", "personas")
+    async def extract_keywords(state: MarketingPlanState) -> MarketingPlanState:
         prompt = f"""
         Thinking like a social media manager what are some keywords you would monitor for {state['appName']} whose value proposition is: {state['value_proposition']}
 
@@ -131,61 +148,59 @@ def create_marketing_graph() -> CompiledStateGraph:
         Return a list of 5 keywords or phrases to search for to find posts to monitor and respond to.  Do not respond with more than 10 phrases.  
         Order the key words in order of relevance to {state['appName']} with the most relevant first.
         """
-        llm = get_llm()
-        structured_llm = llm.with_structured_output(KeywordList)
-        response = structured_llm.invoke(prompt)
+        response = _KEYWORDS_LLM.invoke(prompt)
         return {"keywords": response.keywords}
     
     # Get human feedback node
-    def get_feedback(state: workflow_state) -> workflow_state:
+    def get_feedback(state: MarketingPlanState) -> MarketingPlanState:
         # Here you could implement actual user interaction
         # For now we'll just store it in state
         return {"human_feedback": "Feedback received"}
 
     # End node to properly signal completion
-    def end(state: workflow_state) -> workflow_state:
+    def end(state: MarketingPlanState) -> MarketingPlanState:
         # You can add any final state cleanup or validation here
         #print("Marketing analysis completed:", state)
         return {}
 
-    async def finalize_competitors(state: workflow_state) -> workflow_state:
+    async def finalize_competitors(state: MarketingPlanState) -> MarketingPlanState:
         """
         Analyze search results to create a final list of competitors.
         Uses browser to visit each site and extract relevant information.
         """
-        llm = get_llm()
-
-        results = []
-        for search_result in state["search_results"]:
-            try:
-                doc = await scrape_web(search_result.link)
-                prompt = f"""Extract the following information from this web page content:
-                - All links to top level domains that appear to be competitors to Product Hunt
-                - For each competitor also map their name and a brief description if available.
-                
-                Content:
-                {doc.page_content}
-                """
-                
-                structured_llm = llm.with_structured_output(CompetitorList)
-                competitors = structured_llm.invoke(prompt)
-                results.extend(competitors.competitors)
-            except Exception as e:
-                print(f"Error processing {search_result.link}: {str(e)}")
+        semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+
+        async def handle(search_result):
+            async with semaphore:
+                try:
+                    return search_result, await scrape_web(search_result.link)
+                except Exception:
+                    logger.exception("Error processing %s", search_result.link)
+                    return search_result, None
+
+        # gather keeps search result order so the prompt is the same for the same results
+        pages = []
+        for search_result, doc in await asyncio.gather(*[handle(sr) for sr in state["search_results"]]):
+            if doc is None:
                 continue
+            pages.append(PAGE_TEMPLATE.format(number=len(pages) + 1, url=search_result.link, content=doc.page_content[:MAX_PAGE_CHARS]))
 
-        # Update state with competitors
-        prompt2 = f"""Given the list of competitors below determine which are the most relevant competitors, select no more than 10, to {state['appName']} an app that {state['appDescription']}:
-        Order the list with the most relevant competitors first.
-        Potential competitors:
-        {results}
-        """
-        structured_llm = llm.with_structured_output(CompetitorList)
-        response = structured_llm.invoke(prompt2)
+        if not pages:
+            return {"competitors": [], "search_results": None}
+
+        # One structured call extracts and ranks competitors across all pages
+        prompt = COMPETITOR_TEMPLATE.format(
+            app_name=state['appName'],
+            app_description=state['appDescription'],
+            pages="\n\n".join(pages),
+        )
+        response = await _COMPETITORS_LLM.ainvoke(prompt)
 
-        return {"competitors": response.competitors}
+        # The raw search results are no longer needed, clear them from the state
+        return {"competitors": response.competitors, "search_results": None}
 
-    async def get_marketing_suggestions(state: workflow_state):
+    @cached_node("appName", "appDescription", "keyfeatures", "value_proposition", "competitors")
+    async def get_marketing_suggestions(state: MarketingPlanState):
         prompt = f"""
         Given the following information about {state['appName']} and its competitors, suggest 5 specific marketing strategies to promote {state['appName']}. 
         The strategy should be specific and provide actions to take and details someone can act
@@ -195,9 +210,7 @@ def create_marketing_graph() -> CompiledStateGraph:
         Value proposition: {state['value_proposition']}
         Competitors: {state['competitors']}
         """
-        llm = get_llm()
-        structured_llm = llm.with_structured_output(MarketingStrategiesList)
-        response = structured_llm.invoke(prompt)
+        response = await _STRATEGIES_LLM.ainvoke(prompt)
         # THIS CAUSES langgraph.errors.InvalidUpdateError when get_subreddits does it as well
         #state["marketing_suggestions"] = response.strategies
         #return state
@@ -205,7 +218,8 @@ def create_marketing_graph() -> CompiledStateGraph:
         #print("MARKETING SUGGESTIONS", response.strategies)
         return {"marketing_suggestions": response.strategies}
     
-    async def get_subreddits(state: workflow_state):
+    @cached_node("appName", "appDescription", "keyfeatures", "value_proposition", "competitors")
+    async def get_subreddits(state: MarketingPlanState):
         #print("#####GET SUBREDDITS#########")
         prompt = f"""
         Given the following information about {state['appName']} and its competitors, suggest 5 subreddits to monitor or post on for {state['appName']}.
@@ -214,9 +228,7 @@ def create_marketing_graph() -> CompiledStateGraph:
             Value proposition: {state['value_proposition']}
             Competitors: {state['competitors']}
         """
-        llm = get_llm()
-        structured_llm = llm.with_structured_output(SubredditList)
-        response = structured_llm.invoke(prompt)
+        response = await _SUBREDDITS_LLM.ainvoke(prompt)
         #state["subreddits"] = response.subreddits
         #return state
         #print(f"##### Found {len(response.subreddits)} subreddits")
@@ -257,8 +269,14 @@ def create_marketing_graph() -> CompiledStateGraph:
     #     f.write(graph_image)
     return graph
 
-#define the graph
-marketing_agent = create_marketing_graph()
+_marketing_agent: CompiledStateGraph | None = None
+
+def get_marketing_agent() -> CompiledStateGraph:
+    """Compile the marketing graph on first use instead of at import time."""
+    global _marketing_agent
+    if _marketing_agent is None:
+        _marketing_agent = create_marketing_graph()
+    return _marketing_agent
 
 
 
@@ -279,7 +297,7 @@ async def run_marketing_analysis(
     }
     
     # Create and run graph
-    graph = create_marketing_graph()
+    graph = get_marketing_agent()
     final_state = await graph.arun(initial_state)
     
     return final_state
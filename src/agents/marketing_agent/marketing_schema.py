@@ -1,12 +1,14 @@
 from typing import List
 from typing_extensions import TypedDict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import operator
 from typing import  Annotated
 
 from agents.tools.searchweb import SearchResult
 
 class Persona(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(
         description="Name of the persona"
     )
@@ -18,6 +20,8 @@ class Persona(BaseModel):
         return f"Name: {self.name}\nDescription: {self.description}\n"
 
 class Competitor(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(
         description="Name of the competitor"
     )
@@ -28,6 +32,12 @@ class Competitor(BaseModel):
         description="URL of the competitor",
     )
 
+def search_results_reducer(current: List[SearchResult], update: List[SearchResult] | None) -> List[SearchResult]:
+    # None drops the raw results once they have been consumed so they aren't checkpointed again
+    if update is None:
+        return []
+    return current + update
+
 class MarketingInput(TypedDict):
     appName: str # App Name
     appUrl: str  # App URL
@@ -49,4 +59,4 @@ class MarketingPlanState(TypedDict):
     tagline: str # Tagline
     subreddits: Annotated[List[str], operator.add] # Subreddits, the operator add seems to cause duplicates
     marketing_suggestions: Annotated[List[str], operator.add] # Marketing suggestions
-    search_results: Annotated[List[SearchResult], operator.add] # Search results
\ No newline at end of file
+    search_results: Annotated[List[SearchResult], search_results_reducer] # Search results, cleared by finalize_competitors
\ No newline at end of file
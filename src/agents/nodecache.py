@@ -0,0 +1,152 @@
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Sequence
+
+from pydantic import TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from agents.llmtools import get_llm
+from core import settings
+
+logger = logging.getLogger(__name__)
+
+# The cache is best effort, don't wait long on a database locked by another worker
+_SQLITE_TIMEOUT_SECONDS = 1.0
+
+_setup_lock = threading.Lock()
+_setup_paths: set[str] = set()
+
+
+def _connect() -> sqlite3.Connection:
+    path = settings.NODE_CACHE_PATH
+    with _setup_lock:
+        if path not in _setup_paths:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with sqlite3.connect(path, timeout=_SQLITE_TIMEOUT_SECONDS) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS node_cache (key TEXT PRIMARY KEY, value TEXT, expires_at REAL)"
+                )
+            conn.close()
+            _setup_paths.add(path)
+    return sqlite3.connect(path, timeout=_SQLITE_TIMEOUT_SECONDS)
+
+
+def node_cache_key(node_name: str, state: dict, keys: Sequence[str]) -> str:
+    """Fingerprint a node by its name, the model in use and the state values it reads."""
+    model = getattr(get_llm(), "model_name", None)
+    inputs = [state.get(k) for k in keys]
+    payload = json.dumps([node_name, model, inputs], default=to_jsonable_python, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _delete_cached_update(key: str) -> None:
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM node_cache WHERE key = ?", (key,))
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        logger.warning("Node cache delete failed", exc_info=True)
+
+
+def get_cached_update(key: str, update_types: dict[str, Any] | None = None) -> dict | None:
+    """
+    Return the cached update for key, or None when missing, expired or the cache is unavailable.
+    Values listed in update_types are rebuilt into those types, a row that no longer fits is dropped.
+    """
+    try:
+        conn = _connect()
+        try:
+            row = conn.execute(
+                "SELECT value FROM node_cache WHERE key = ? AND expires_at > ?", (key, time.time())
+            ).fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        logger.warning("Node cache lookup failed", exc_info=True)
+        return None
+    if not row:
+        return None
+    try:
+        update = json.loads(row[0])
+        for field, field_type in (update_types or {}).items():
+            if field in update:
+                update[field] = TypeAdapter(field_type).validate_python(update[field])
+        return update
+    except Exception:
+        # Usually a schema change since the row was written, treat it as a miss
+        logger.warning("Discarding unreadable node cache entry", exc_info=True)
+        _delete_cached_update(key)
+        return None
+
+
+def set_cached_update(key: str, update: dict) -> None:
+    """Store update under key, cache failures are logged and otherwise ignored."""
+    expires_at = time.time() + settings.NODE_CACHE_TTL_SECONDS
+    try:
+        value = json.dumps(to_jsonable_python(update))
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO node_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at),
+                )
+        finally:
+            conn.close()
+    except Exception:
+        logger.warning("Node cache store failed", exc_info=True)
+
+
+def cached_node(*keys: str, update_types: dict[str, Any] | None = None) -> Callable:
+    """
+    Cache the partial state update returned by a graph node.
+
+    The cache key is built from the node name, the model and the state values listed in keys,
+    so repeat runs with the same inputs skip the LLM call until NODE_CACHE_TTL_SECONDS pass.
+    Updates are stored as JSON; update_types maps fields holding models (e.g. List[Persona])
+    to the type they are rebuilt into on a hit.
+    Caching only happens when NODE_CACHE_PATH is set. Works for both sync and async nodes.
+    """
+    def decorator(fn: Callable) -> Callable:
+        def lookup(state: dict) -> tuple[str, dict | None]:
+            key = node_cache_key(fn.__name__, state, keys)
+            return key, get_cached_update(key, update_types)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(state: dict) -> Any:
+                if not settings.NODE_CACHE_PATH:
+                    return await fn(state)
+                # sqlite is blocking, keep it off the event loop so parallel nodes still overlap
+                key, cached = await asyncio.to_thread(lookup, state)
+                if cached is not None:
+                    return cached
+                update = await fn(state)
+                await asyncio.to_thread(set_cached_update, key, update)
+                return update
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(state: dict) -> Any:
+            if not settings.NODE_CACHE_PATH:
+                return fn(state)
+            key, cached = lookup(state)
+            if cached is not None:
+                return cached
+            update = fn(state)
+            set_cached_update(key, update)
+            return update
+        return wrapper
+
+    return decorator
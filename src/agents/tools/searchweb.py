@@ -1,3 +1,8 @@
+import asyncio
+import logging
+import threading
+import weakref
+from functools import cache
 from typing import List
 from langchain_community.tools.tavily_search import TavilySearchResults,TavilyAnswer
 from langchain_community.document_loaders import WebBaseLoader
@@ -5,6 +10,8 @@ from pydantic import BaseModel, Field
 from browser_use import ActionResult, Agent, Browser, BrowserConfig, Controller
 from agents.llmtools import get_llm
 
+logger = logging.getLogger(__name__)
+
 #Another scrape to consider https://github.com/dendrite-systems/dendrite-python-sdk
 
 class SearchQuery(BaseModel):
@@ -14,13 +21,17 @@ class SearchResult(BaseModel):
     link:str = Field(None, description="Link to the search result.")
     content:str = Field(None, description="Content of the search result.")
 
+@cache
+def get_structured_llm(output_model: type[BaseModel]):
+    """Bind structured output once per model so its JSON schema isn't rebuilt on every call"""
+    return get_llm().with_structured_output(output_model)
+
 def search_web(instructions: str, max_results: int = 3)->List[SearchResult]:
     """ Retrieve docs from web search after generating a search query from llm"""
 
-    llm = get_llm()
-    structured_llm = llm.with_structured_output(SearchQuery)
+    structured_llm = get_structured_llm(SearchQuery)
     search_query = structured_llm.invoke([instructions])
-    print("SEARCH QUERY: ", search_query.search_query)
+    logger.debug("Search query: %s", search_query.search_query)
     return search_web_with_query(search_query.search_query, max_results)
 
 
@@ -39,7 +50,7 @@ def search_web_with_query(query: str, max_results: int = 3)->List[SearchResult]:
     search_docs = tavily_search.invoke(query)
     # Check if search_docs is a string (likely an error)
     if isinstance(search_docs, str):
-        print(f"Error in search results: {search_docs}")
+        logger.warning("Error in search results: %s", search_docs)
         return []  # Return empty list to avoid downstream errors
    
     return [SearchResult(link=doc["url"], content=doc["content"]) for doc in search_docs]
@@ -56,20 +67,36 @@ def search_web_get_answer(query: str)->str:
 
     return answer
 
+# Max number of concurrent scrape_web fetches per event loop
+SCRAPE_POOL_SIZE = 3
+
+# asyncio semaphores belong to a single loop and scrape_web also runs under
+# asyncio.run() in crew tool threads, so each loop gets its own bound
+_scrape_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_scrape_semaphores_lock = threading.Lock()
+
+def _get_scrape_semaphore() -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    with _scrape_semaphores_lock:
+        semaphore = _scrape_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = _scrape_semaphores[loop] = asyncio.Semaphore(SCRAPE_POOL_SIZE)
+    return semaphore
+
 async def scrape_web(url: str) -> str:
     """Scrape the web page asynchronously"""
     loader = WebBaseLoader(url)
     # Load the page asynchronously
     docs = []
-    async for doc in loader.alazy_load():
-        docs.append(doc)
+    async with _get_scrape_semaphore():
+        async for doc in loader.alazy_load():
+            docs.append(doc)
     #print(docs[0].page_content[:100])
     return docs[0]
 
 async def scrape_web_agent(url: str, query: str, output_model: type[BaseModel]) -> BaseModel:
-    llm = get_llm()
     doc = await scrape_web(url)
-    structured_llm = llm.with_structured_output(output_model)
+    structured_llm = get_structured_llm(output_model)
     result = await structured_llm.ainvoke(
         [query + "\n\n" + doc.page_content],
         config={"temperature": 0.3}
@@ -49,6 +49,13 @@ class Settings(BaseSettings):
 
     OPENWEATHERMAP_API_KEY: SecretStr | None = None
 
+    # SQLite file the service uses to persist graph checkpoints across restarts
+    CHECKPOINT_DB_PATH: str = "checkpoints.db"
+
+    # SQLite file used to cache marketing agent node results, caching is off when unset
+    NODE_CACHE_PATH: str | None = None
+    NODE_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+
     LANGCHAIN_TRACING_V2: bool = False
     LANGCHAIN_PROJECT: str = "default"
     LANGCHAIN_ENDPOINT: Annotated[str, BeforeValidator(check_str_is_http)] = (
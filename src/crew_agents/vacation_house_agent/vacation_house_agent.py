@@ -58,11 +58,9 @@ class VacationHouseAgent(CrewAgent):
             self.local_expert()
         ]
 
-    def create_tasks(self, query: str) -> List[Task]:
-        """Create and return the list of tasks for the vacation house search."""
-        city_researcher = self.city_researcher()
-        real_estate_agent = self.real_estate_agent()
-        local_expert = self.local_expert()
+    def create_tasks(self, query: str, agents: List[Agent]) -> List[Task]:
+        """Create and return the list of tasks for the vacation house search using the agents from create_agents."""
+        city_researcher, real_estate_agent, local_expert = agents
 
         city_research_task = self.find_candidate_cities_task(city_researcher, query)
         real_estate_task = self.find_vacation_homes_task(real_estate_agent, query, city_research_task)
@@ -257,7 +255,7 @@ class VacationHouseAgent(CrewAgent):
         
         # Create agents and tasks
         agents = self.create_agents()
-        tasks = self.create_tasks(query)
+        tasks = self.create_tasks(query, agents)
         
         # Create and run the crew
         crew = Crew(
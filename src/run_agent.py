@@ -8,9 +8,9 @@ from agents.marketing_agent.marketing_schema import MarketingInput, MarketingPla
 
 load_dotenv()
 
-from agents import DEFAULT_AGENT, all_agents  # noqa: E402
+from agents import DEFAULT_AGENT, get_agent  # noqa: E402
 
-agent = all_agents[DEFAULT_AGENT]
+agent = get_agent(DEFAULT_AGENT)
 
 
 async def main() -> None:
@@ -20,7 +20,7 @@ async def main() -> None:
         "competitor_hint": "Flavortown USA",
         "max_personas": 2,
     }
-    result = await agent.graph.ainvoke(
+    result = await agent.ainvoke(
         initial_state,
         config=RunnableConfig(configurable={"thread_id": uuid4()}),
     )
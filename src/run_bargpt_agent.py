@@ -1,3 +1,4 @@
+import asyncio
 from dotenv import load_dotenv
 import logging
 from typing import Dict, Any
@@ -10,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 from agents.privateagents.private.bargpt_agent.bargpt_trending_flow import BarGPTTrendingPostFlow
 
-def run_trending_flow() -> Dict[str, Any]:
+async def run_trending_flow() -> Dict[str, Any]:
     """
     Run the BarGPT trending post flow to generate and publish trending cocktail content.
     
@@ -23,13 +24,14 @@ def run_trending_flow() -> Dict[str, Any]:
         #result = flow.run({})
         #logger.info(f"Flow completed successfully: {result}")
         research_agent = ResearchAgent()
-        result = research_agent.run({"request": "What are the latest trending topics?", "recent_topics": ['old topic 1', 'old topic 2']})
+        # ResearchAgent.run is blocking, run it in a thread so other flows can be awaited alongside it
+        result = await asyncio.to_thread(research_agent.run, {"request": "What are the latest trending topics?", "recent_topics": ['old topic 1', 'old topic 2']})
       
         return result
-    except Exception as e:
-        logger.error(f"Error running trending flow: {e}")
+    except Exception:
+        logger.exception("Error running trending flow")
         raise
 
 if __name__ == "__main__":
     load_dotenv()
-    run_trending_flow()
+    asyncio.run(run_trending_flow())
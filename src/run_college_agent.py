@@ -9,9 +9,9 @@ from agents.marketing_agent.marketing_schema import MarketingInput, MarketingPla
 
 load_dotenv()
 
-from agents import DEFAULT_AGENT, all_agents  # noqa: E402
+from agents import DEFAULT_AGENT, get_agent  # noqa: E402
 
-agent = all_agents["college-agent"]
+agent = get_agent("college-agent")
 
 
 async def main() -> None:
@@ -24,7 +24,7 @@ async def main() -> None:
         "search_query": "division 3 baseball schools campus size greater than 1500 students",
         "sat_score": 1200,
     }
-    result = await agent.graph.ainvoke(
+    result = await agent.ainvoke(
         initial_state,
         config=RunnableConfig(configurable={"thread_id": uuid4()}),
     )
@@ -31,7 +31,7 @@ if __name__ == "__main__":
         host=settings.HOST, 
         port=settings.PORT, 
         reload=settings.is_dev(),
-        loop="asyncio",  # Explicitly set the event loop
+        loop="auto",  # Uses uvloop when installed (Linux/macOS), falls back to asyncio
         workers=4,  # Add multiple workers to handle concurrent requests
         log_level="debug" if settings.is_dev() else "info",
         timeout_keep_alive=30,  # Adjust keep-alive timeout
@@ -8,9 +8,9 @@ from agents.marketing_agent.marketing_schema import MarketingInput, MarketingPla
 
 load_dotenv()
 
-from agents import DEFAULT_AGENT, all_agents  # noqa: E402
+from agents import DEFAULT_AGENT, get_agent  # noqa: E402
 
-agent = all_agents[DEFAULT_AGENT]
+agent = get_agent(DEFAULT_AGENT)
 
 
 async def main() -> None:
@@ -25,7 +25,7 @@ async def main() -> None:
     thread = {"configurable": {"thread_id": "1"}}
 
     # Convert the AddableValuesDict to a regular dict and then to JSON
-    async for event in agent.graph.astream(initial_state, thread, stream_mode="values"):
+    async for event in agent.astream(initial_state, thread, stream_mode="values"):
         # Review
        print("[EVENT]", event)
 
@@ -0,0 +1,104 @@
+import asyncio
+import sqlite3
+from typing import List
+
+import pytest
+from pydantic import BaseModel
+
+from agents import nodecache
+from core import settings
+
+
+class Item(BaseModel):
+    name: str
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    path = str(tmp_path / "node_cache.db")
+    monkeypatch.setattr(settings, "NODE_CACHE_PATH", path)
+    monkeypatch.setattr(settings, "NODE_CACHE_TTL_SECONDS", 60)
+    return path
+
+
+def test_sync_node_hit_and_miss(cache_path):
+    calls = []
+
+    @nodecache.cached_node("a")
+    def node(state):
+        calls.append(state["a"])
+        return {"out": [state["a"]]}
+
+    assert node({"a": 1}) == {"out": [1]}
+    assert node({"a": 1}) == {"out": [1]}
+    assert node({"a": 2}) == {"out": [2]}
+    assert calls == [1, 2]
+
+
+def test_async_node_hit(cache_path):
+    calls = []
+
+    @nodecache.cached_node("a")
+    async def node(state):
+        calls.append(state["a"])
+        return {"out": state["a"]}
+
+    assert asyncio.run(node({"a": 1})) == {"out": 1}
+    assert asyncio.run(node({"a": 1})) == {"out": 1}
+    assert calls == [1]
+
+
+def test_update_types_rebuild_models(cache_path):
+    @nodecache.cached_node("a", update_types={"items": List[Item]})
+    def node(state):
+        return {"items": [Item(name="x")]}
+
+    node({"a": 1})
+    cached = node({"a": 1})
+    assert cached == {"items": [Item(name="x")]}
+    assert isinstance(cached["items"][0], Item)
+
+
+def test_expired_entry_is_a_miss(cache_path, monkeypatch):
+    monkeypatch.setattr(settings, "NODE_CACHE_TTL_SECONDS", -1)
+    calls = []
+
+    @nodecache.cached_node("a")
+    def node(state):
+        calls.append(state["a"])
+        return {"out": state["a"]}
+
+    node({"a": 1})
+    node({"a": 1})
+    assert calls == [1, 1]
+
+
+def test_unreadable_entry_is_dropped(cache_path):
+    calls = []
+
+    @nodecache.cached_node("a", update_types={"items": List[Item]})
+    def node(state):
+        calls.append(state["a"])
+        return {"items": [Item(name="x")]}
+
+    node({"a": 1})
+    with sqlite3.connect(cache_path) as conn:
+        conn.execute("UPDATE node_cache SET value = ?", ('{"items": [{"wrong": 1}]}',))
+    conn.close()
+
+    assert node({"a": 1}) == {"items": [Item(name="x")]}
+    assert calls == [1, 1]
+
+
+def test_disabled_cache_always_runs_node(monkeypatch):
+    monkeypatch.setattr(settings, "NODE_CACHE_PATH", None)
+    calls = []
+
+    @nodecache.cached_node("a")
+    def node(state):
+        calls.append(state["a"])
+        return {"out": state["a"]}
+
+    node({"a": 1})
+    node({"a": 1})
+    assert calls == [1, 1]